@@ -1,12 +1,19 @@
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from datetime import datetime
+from html import unescape
+import bisect
 import csv
+import functools
+import re
+import threading
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
-import json
+import orjson
 
 # --- Detect if ANSI colors are supported ---
 def supports_ansi():
@@ -27,8 +34,8 @@ DARK_RED = "\033[31m" if USE_COLOR else ""
 
 # --- Load Steam config from JSON ---
 CONFIG_FILE = "steam_config.json"
-with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-    steam_config = json.load(f)
+with open(CONFIG_FILE, "rb") as f:
+    steam_config = orjson.loads(f.read())
 
 steamid = steam_config.get("steamid", "defaultid")
 cookies = {
@@ -36,52 +43,112 @@ cookies = {
     "steamLoginSecure": steam_config.get("steamLoginSecure", "")
 }
 
+# One pooled session: keep-alive avoids a TCP/TLS handshake per page and
+# gzip shrinks the HTML payload Steam sends back.
+SESSION = requests.Session()
+SESSION.headers.update({
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "User-Agent": "Mozilla/5.0 (compatible; cs-case-logger)",
+})
+SESSION.cookies.update(cookies)
+
 # --- Helpers ---
 def print_heading(text):
     print(f"{GREEN}{text}{RESET}")
 
-def highlight_stattrak(item_name, rarity_color):
-    if "StatTrak™" in item_name and USE_COLOR:
-        return item_name.replace(
-            "StatTrak™",
-            f"{YELLOW}StatTrak™{rarity_color}"
-        )
-    return f"{rarity_color}{item_name}"
+STATTRAK_YELLOW = f"{YELLOW}StatTrak™"
+
+# USE_COLOR never changes after startup, so bind the right variant once
+# instead of re-checking the global on every call.
+if USE_COLOR:
+    def highlight_stattrak(item_name, rarity_color):
+        if "StatTrak™" in item_name:
+            return item_name.replace("StatTrak™", STATTRAK_YELLOW + rarity_color, 1)
+        return f"{rarity_color}{item_name}"
 
-def highlight_case_name(case_name):
-    return f"{GREEN}{case_name}{RESET}" if USE_COLOR else case_name
+    def highlight_case_name(case_name):
+        return f"{GREEN}{case_name}{RESET}"
+else:
+    def highlight_stattrak(item_name, rarity_color):
+        return item_name
 
-def print_item_history(item_name, last_dt, all_cases):
+    def highlight_case_name(case_name):
+        return case_name
+
+def print_item_history(item_name, last_dt, case_dts):
     if last_dt:
-        cases_since = sum(1 for _, dt_obj, *_ in all_cases if dt_obj and dt_obj > last_dt)
+        cases_since = len(case_dts) - bisect.bisect_right(case_dts, last_dt)
         msg = f"{YELLOW}Cases opened since last {item_name} ({last_dt.strftime('%Y-%m-%d %H:%M:%S')}): {cases_since}{RESET}"
         print(f"\n{msg}")
     else:
         msg = f"{DARK_RED}No {item_name.lower()} found in history.{RESET}"
         print(f"\n{msg}")
 
+STATTRAK_PREFIX = "StatTrak™ "
+
+@functools.lru_cache(maxsize=None)
 def normalize_name(name):
-    if name.startswith("StatTrak™ "):
-        name = name[len("StatTrak™ "):]
-    return name.strip().lower()
+    return name.removeprefix(STATTRAK_PREFIX).strip().lower()
 
+@functools.lru_cache(maxsize=None)
 def is_stattrak(item_name):
-    return item_name.startswith("StatTrak™ ")
+    return item_name.startswith(STATTRAK_PREFIX)
 
-def fetch_steam_data(url, cookies, retries=5, delay=5):
+def fetch_steam_data(url, session, retries=5, delay=5):
     for attempt in range(1, retries + 1):
         try:
-            resp = requests.get(url, cookies=cookies, timeout=10)
-            data = resp.json()
+            resp = session.get(url, timeout=10)
+            data = orjson.loads(resp.content)
             if data is None or "html" not in data:
                 raise ValueError("Empty or invalid response")
             return data
-        except (requests.RequestException, ValueError, json.JSONDecodeError) as e:
+        except (requests.RequestException, ValueError, orjson.JSONDecodeError) as e:
             print(f"Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s...")
             time.sleep(delay)
     print("Failed to fetch data after multiple attempts. Exiting.")
     return None
 
+def fetch_steam_data_delayed(url, session):
+    # Steam wants a pause between paginated requests; doing it in the
+    # worker thread lets the main thread parse the previous page meanwhile.
+    time.sleep(3)
+    return fetch_steam_data(url, session)
+
+# Cursors cached from a full crawl let later runs fetch pages in
+# parallel instead of discovering each cursor from the previous page.
+CURSORS_FILE = "cursors.json"
+FETCH_WORKERS = 4
+FETCH_SPACING = 3 / FETCH_WORKERS
+
+_rate_lock = threading.Lock()
+_last_fetch = 0.0
+
+def fetch_steam_data_paced(url, session):
+    # Space out request starts so FETCH_WORKERS threads still respect
+    # Steam's ~3 s per-request rate limit in aggregate.
+    global _last_fetch
+    with _rate_lock:
+        wait = _last_fetch + FETCH_SPACING - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_fetch = time.monotonic()
+    return fetch_steam_data(url, session)
+
+def load_cached_cursors():
+    try:
+        with open(CURSORS_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def save_cursors(cursors):
+    try:
+        with open(CURSORS_FILE, "wb") as f:
+            f.write(orjson.dumps(cursors))
+    except OSError:
+        pass
+
 # --- Extract item info from page descriptions ---
 def get_item_category(tags):
     if not tags:
@@ -94,34 +161,59 @@ def get_item_category(tags):
     else:
         return type_name.title()
 
-def get_item_info(descriptions_json, classid, instanceid):
-    if not classid or not instanceid:
-        return "Unknown", "Unknown", "Unknown"
-    key = f"{classid}_{instanceid}"
-    item = descriptions_json.get("730", {}).get(key, {})
-    tags = item.get("tags", [])
-    rarity = tags[4]["name"]
-    wear = tags[5]["name"]
-    category = get_item_category(tags)
-    return rarity, wear, category
-
-def parse_timestamp(entry):
-    date_div = entry.find("div", class_="tradehistory_date")
-    ts_div = entry.find("div", class_="tradehistory_timestamp")
-    if date_div and ts_div:
-        date_str = date_div.contents[0].strip()
-        time_str = ts_div.get_text(strip=True)
-        combined = f"{date_str} {time_str}"
+UNKNOWN_INFO = ("Unknown", "Unknown", "Unknown")
+
+def build_desc_map(descriptions_json):
+    # Flatten a page's descriptions to {classid_instanceid: (rarity, wear, category)}
+    # so process_case does a single dict hit per item.
+    return {
+        key: (tags[4]["name"], tags[5]["name"], get_item_category(tags))
+        for key, item in descriptions_json.get("730", {}).items()
+        if (tags := item.get("tags")) and len(tags) > 5
+    }
+
+MONTHS = {"Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+          "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12}
+STEAM_DT_FORMAT = "%d %b, %Y %I:%M%p"
+READABLE_DT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+@functools.lru_cache(maxsize=None)
+def to_datetime(date_str, time_str):
+    # Hand-rolled parse of "27 Aug, 2024" + "1:23am"; strptime re-parses
+    # the format string and is locale-aware, making it ~10x slower.
+    try:
+        day, mon, year = date_str.split()
+        hour, minute = time_str[:-2].split(":")
+        ampm = time_str[-2:].lower()
+        hour = int(hour) % 12
+        if ampm == "pm":
+            hour += 12
+        elif ampm != "am":
+            raise ValueError(time_str)
+        dt_obj = datetime(int(year), MONTHS[mon.rstrip(",")], int(day), hour, int(minute))
+    except (KeyError, ValueError):
         try:
-            dt_obj = datetime.strptime(combined, "%d %b, %Y %I:%M%p")
-            readable_time = dt_obj.strftime("%Y-%m-%d %H:%M:%S")
+            dt_obj = datetime.strptime(f"{date_str} {time_str}", STEAM_DT_FORMAT)
         except Exception:
-            dt_obj = None
-            readable_time = combined
-    else:
-        dt_obj = None
-        readable_time = "Unknown"
-    return readable_time, dt_obj
+            return f"{date_str} {time_str}", None
+    return dt_obj.strftime(READABLE_DT_FORMAT), dt_obj
+
+# Compiled once: libxml2 evaluates these without re-parsing the
+# expression, and elements come back as plain lxml nodes (no wrapper
+# objects as with BeautifulSoup).
+ROW_XP = etree.XPath("descendant-or-self::div[contains(concat(' ', normalize-space(@class), ' '), ' tradehistoryrow ')]")
+DATE_XP = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' tradehistory_date ')]/text()")
+TS_XP = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' tradehistory_timestamp ')]/text()")
+ITEMS_XP = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' tradehistory_items ')]")
+PLUSMINUS_XP = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' tradehistory_items_plusminus ')]/text()")
+ITEM_XP = etree.XPath(".//*[contains(concat(' ', normalize-space(@class), ' '), ' history_item ')]")
+
+def parse_timestamp(entry):
+    dates = DATE_XP(entry)
+    times = TS_XP(entry)
+    if dates and times:
+        return to_datetime(dates[0].strip(), times[0].strip())
+    return "Unknown", None
 
 def extract_item_and_case(entry):
     item_name = None
@@ -129,26 +221,21 @@ def extract_item_and_case(entry):
     item_classid = None
     item_instanceid = None
 
-    items_blocks = entry.find_all("div", class_="tradehistory_items")
-    for block in items_blocks:
-        plusminus_div = block.find("div", class_="tradehistory_items_plusminus")
-        group_div = block.find("div", class_="tradehistory_items_group")
-        if not plusminus_div or not group_div:
-            continue
-
-        sign = plusminus_div.get_text(strip=True)
-        history_items = group_div.find_all(class_="history_item")
-        if not history_items:
+    for block in ITEMS_XP(entry):
+        signs = PLUSMINUS_XP(block)
+        history_items = ITEM_XP(block)
+        if not signs or not history_items:
             continue
 
+        sign = signs[0].strip()
         if sign == "+":
             h = history_items[0]
-            item_name = h.get_text(strip=True)
+            item_name = h.text_content().strip()
             item_classid = h.get("data-classid")
             item_instanceid = h.get("data-instanceid")
         elif sign == "-":
             h = history_items[-1]
-            case_name = h.get_text(strip=True)
+            case_name = h.text_content().strip()
 
             # Sometimes case_name is the first item in the lsit
             if 'Key' in case_name:
@@ -159,13 +246,15 @@ def extract_item_and_case(entry):
 
     return item_name, case_name, item_classid, item_instanceid
 
-def parse_cases(html):
-    soup = BeautifulSoup(html, "html.parser")
+def parse_cases_lxml(html):
+    root = lxml_html.fromstring(html)
     cases = []
 
-    for entry in soup.find_all("div", class_="tradehistoryrow"):
-        text = entry.get_text(" ", strip=True)
-        if "Unlocked a container" not in text or "Genesis Terminal" in text:
+    for entry in ROW_XP(root):
+        # Filter on the raw markup before any text extraction; the full
+        # subtree text walk is only worth doing for rows we keep.
+        raw = etree.tostring(entry, encoding="unicode")
+        if "Unlocked a container" not in raw or "Genesis Terminal" in raw:
             continue
 
         readable_time, dt_obj = parse_timestamp(entry)
@@ -175,110 +264,272 @@ def parse_cases(html):
             continue
 
         cases.append(
-            (readable_time, dt_obj, item_name, case_name, text, item_classid, item_instanceid)
+            (readable_time, dt_obj, item_name, case_name, item_classid, item_instanceid)
         )
 
     return cases
 
-def get_color(rarity):
-    if not USE_COLOR:
+# --- Regex fast path for Steam's fixed tradehistoryrow markup ---
+# Rows are sliced out at their opening tag; each slice runs to the start
+# of the next row (or end of page), which is all the inner regexes need.
+ROW_RE = re.compile(r'<div class="tradehistoryrow[^"]*">')
+DATE_RE = re.compile(r'class="tradehistory_date[^"]*">\s*([^<]+?)\s*<')
+TS_RE = re.compile(r'class="tradehistory_timestamp[^"]*">\s*([^<]+?)\s*<')
+ITEMS_RE = re.compile(r'class="tradehistory_items(?: [^"]*)?">')
+PLUSMINUS_RE = re.compile(r'class="tradehistory_items_plusminus[^"]*">\s*([+-])')
+HISTORY_ITEM_RE = re.compile(
+    r'<(a|span)\b([^>]*class="[^"]*history_item[^"]*"[^>]*)>(.*?)</\1>', re.S
+)
+CLASSID_RE = re.compile(r'data-classid="(\d+)"')
+INSTANCEID_RE = re.compile(r'data-instanceid="(\d+)"')
+TAG_RE = re.compile(r"<[^>]+>")
+
+def parse_timestamp_re(row_html):
+    date_m = DATE_RE.search(row_html)
+    ts_m = TS_RE.search(row_html)
+    if date_m and ts_m:
+        return to_datetime(date_m.group(1), ts_m.group(1))
+    return "Unknown", None
+
+def extract_item_and_case_re(row_html):
+    item_name = None
+    case_name = None
+    item_classid = None
+    item_instanceid = None
+
+    for items_html in ITEMS_RE.split(row_html)[1:]:
+        sign_m = PLUSMINUS_RE.search(items_html)
+        if not sign_m:
+            continue
+
+        sign = sign_m.group(1)
+        history_items = HISTORY_ITEM_RE.findall(items_html)
+        if not history_items:
+            continue
+
+        if sign == "+":
+            _, attrs, inner = history_items[0]
+            item_name = unescape(TAG_RE.sub("", inner).strip())
+            cid = CLASSID_RE.search(attrs)
+            iid = INSTANCEID_RE.search(attrs)
+            item_classid = cid.group(1) if cid else None
+            item_instanceid = iid.group(1) if iid else None
+        elif sign == "-":
+            _, _, inner = history_items[-1]
+            case_name = unescape(TAG_RE.sub("", inner).strip())
+
+            # Sometimes case_name is the first item in the lsit
+            if 'Key' in case_name:
+                case_name = case_name.replace(' Key', '')
+
+    if not case_name:
+        case_name = "Unknown Case"
+
+    return item_name, case_name, item_classid, item_instanceid
+
+# Flip off to fall back to the lxml tree parser when debugging.
+USE_REGEX_PARSER = True
+
+def parse_cases(html):
+    if not USE_REGEX_PARSER:
+        return parse_cases_lxml(html)
+
+    cases = []
+    for row_html in ROW_RE.split(html)[1:]:
+        # Cheap raw-substring filter before any regex work on the row.
+        if "Unlocked a container" not in row_html or "Genesis Terminal" in row_html:
+            continue
+
+        readable_time, dt_obj = parse_timestamp_re(row_html)
+        item_name, case_name, item_classid, item_instanceid = extract_item_and_case_re(row_html)
+
+        if not item_name:
+            continue
+
+        cases.append(
+            (readable_time, dt_obj, item_name, case_name, item_classid, item_instanceid)
+        )
+
+    return cases
+
+# Steam rarity strings carry suffixes like "Grade", so match by substring.
+RARITY_COLOR = {
+    "Mil-Spec": "\033[94m",
+    "Restricted": "\033[95m",
+    "Classified": "\033[35m",
+    "Covert": "\033[91m",
+    "Consumer": "\033[37m",
+    "Industrial": "\033[37m",
+    "Contraband": "\033[93m",
+}
+
+if USE_COLOR:
+    @functools.lru_cache(maxsize=None)
+    def get_color(rarity):
+        return next((c for k, c in RARITY_COLOR.items() if k in rarity), "\033[90m")
+else:
+    def get_color(rarity):
         return ""
-    if "Mil-Spec" in rarity:
-        return "\033[94m"
-    elif "Restricted" in rarity:
-        return "\033[95m"
-    elif "Classified" in rarity:
-        return "\033[35m"
-    elif "Covert" in rarity:
-        return "\033[91m"
-    elif "Consumer" in rarity or "Industrial" in rarity:
-        return "\033[37m"
-    elif "Contraband" in rarity:
-        return "\033[93m"
-    else:
-        return "\033[90m"
 
-def process_case(case, writer, all_cases, descriptions_json,
+def process_page(cases, csv_rows, all_cases, desc_map,
                  stattrak_count, last_knife_dt, last_gloves_dt, skin_counter,
                  rarity_counter, case_counter, special_drops):
-    readable_time, dt_obj, item_name, case_name, desc, classid, instanceid = case
-    all_cases.append(case)
+    all_cases.extend(cases)
 
-    rarity, wear, category = get_item_info(descriptions_json, classid, instanceid)
+    infos = [desc_map.get(f"{case[4]}_{case[5]}", UNKNOWN_INFO) for case in cases]
+    stattrak_flags = [is_stattrak(case[2]) for case in cases]
 
-    if "Knife" in category and dt_obj:
-        last_knife_dt = dt_obj
-    if "Glove" in category and dt_obj:
-        last_gloves_dt = dt_obj
+    # Column-wise aggregation: Counter.update counts an iterable in C,
+    # instead of a Python-level increment per case.
+    skin_counter.update(normalize_name(case[2]) for case in cases)
+    rarity_counter.update(info[0] for info in infos)
+    case_counter.update(case[3] for case in cases)
+    stattrak_count += sum(stattrak_flags)
 
-    stattrak_flag = "Yes" if is_stattrak(item_name) else "No"
-    rarity_color = get_color(rarity)
-    display_name = highlight_stattrak(item_name, rarity_color)
-    case_name_colored = highlight_case_name(case_name)
+    lines = []
+    for case, (rarity, wear, category), stattrak in zip(cases, infos, stattrak_flags):
+        readable_time, dt_obj, item_name, case_name, _, _ = case
 
-    print(f"[{readable_time}] {case_name_colored}{RESET} → {display_name} → Rarity: {rarity}{RESET} → Wear: {wear}")
+        if "Knife" in category and dt_obj:
+            last_knife_dt = dt_obj
+        if "Glove" in category and dt_obj:
+            last_gloves_dt = dt_obj
 
-    writer.writerow([readable_time, item_name, case_name, desc, rarity, wear, stattrak_flag])
+        stattrak_flag = "Yes" if stattrak else "No"
+        rarity_color = get_color(rarity)
+        display_name = highlight_stattrak(item_name, rarity_color)
+        case_name_colored = highlight_case_name(case_name)
 
-    stattrak_count += 1 if stattrak_flag == "Yes" else 0
-    skin_counter[normalize_name(item_name)] += 1
-    rarity_counter[rarity] += 1
-    case_counter[case_name] += 1
+        lines.append(f"[{readable_time}] {case_name_colored}{RESET} → {display_name} → Rarity: {rarity}{RESET} → Wear: {wear}")
 
-    # --- Track special drops including gloves (Extraordinary) ---
-    if rarity in ["Classified", "Covert", "Contraband", "Extraordinary"]:
-        special_drops.append((readable_time, item_name, rarity, wear, case_name, stattrak_flag))
+        csv_rows.append((readable_time, item_name, case_name, rarity, wear, stattrak_flag))
+
+        # --- Track special drops including gloves (Extraordinary) ---
+        if rarity in ["Classified", "Covert", "Contraband", "Extraordinary"]:
+            special_drops.append((readable_time, item_name, rarity, wear, case_name, stattrak_flag))
+
+    # One write per page; print() would flush per case.
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     return stattrak_count, last_knife_dt, last_gloves_dt
 
-def paginate_inventory(url, cookies):
+def cursor_url(cursor):
+    return (
+        f"https://steamcommunity.com/id/{steamid}/inventoryhistory/?ajax=1"
+        f"&cursor[time]={cursor['time']}"
+        f"&cursor[time_frac]={cursor['time_frac']}"
+        f"&cursor[s]={cursor['s']}"
+    )
+
+def iter_pages_serial(url, session, cursors_out):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch_steam_data, url, session)
+        while True:
+            data = future.result()
+            if data is None:
+                break
+
+            # Submit the next fetch (with its rate-limit sleep) before
+            # yielding, so the network wait overlaps the parsing below.
+            cursor = data.get("cursor")
+            if cursor:
+                cursors_out.append(cursor)
+                future = executor.submit(fetch_steam_data_delayed, cursor_url(cursor), session)
+
+            yield data
+
+            if not cursor:
+                break
+
+def iter_pages_concurrent(url, session, cached_cursors, cursors_out):
+    # New events shift the whole history, so a fresh page 1 can end
+    # before the first cached page begins. Walk serially from the top
+    # until we land on a cursor we know; only the cached pages from
+    # that point on still tile the history and are safe to parallelize.
+    data = fetch_steam_data(url, session)
+    if data is None:
+        return
+    cursor = data.get("cursor")
+    if cursor:
+        cursors_out.append(cursor)
+    yield data
+
+    while cursor and cursor not in cached_cursors:
+        data = fetch_steam_data_delayed(cursor_url(cursor), session)
+        if data is None:
+            return
+        cursor = data.get("cursor")
+        if cursor:
+            cursors_out.append(cursor)
+        yield data
+
+    if not cursor:
+        return
+
+    remaining = cached_cursors[cached_cursors.index(cursor):]
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = [executor.submit(fetch_steam_data_paced, cursor_url(c), session) for c in remaining]
+        for future in futures:
+            data = future.result()
+            if data is None:
+                return
+            cursor = data.get("cursor")
+            if cursor:
+                cursors_out.append(cursor)
+            yield data
+
+    # A stale cache (e.g. from an aborted crawl) may end early; finish serially.
+    if cursor and cursor not in cached_cursors:
+        yield from iter_pages_serial(cursor_url(cursor), session, cursors_out)
+
+def iter_pages(url, session, cursors_out):
+    cached = load_cached_cursors()
+    if cached:
+        return iter_pages_concurrent(url, session, cached, cursors_out)
+    return iter_pages_serial(url, session, cursors_out)
+
+def paginate_inventory(url, session):
     total = 0
     stattrak_count = 0
     last_knife_dt = None
     last_gloves_dt = None
     all_cases = []
+    # Counters again (not defaultdict): process_page feeds them whole
+    # iterables through Counter.update, which counts in C.
     skin_counter = Counter()
     rarity_counter = Counter()
     case_counter = Counter()
     special_drops = []
 
-    with open("case_openings.csv", "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Timestamp", "Item Name", "Case Name", "Description", "Rarity", "Wear", "StatTrak"])
-
-        while True:
-            data = fetch_steam_data(url, cookies)
-            if data is None:
-                break
+    with open("case_openings.csv", "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+        writer.writerow(["Timestamp", "Item Name", "Case Name", "Rarity", "Wear", "StatTrak"])
+        csv_rows = []
 
+        page_cursors = []
+        for data in iter_pages(url, session, page_cursors):
             cases = parse_cases(data.get("html", ""))
-            descriptions_json = data.get("descriptions", {})
+            desc_map = build_desc_map(data.get("descriptions", {}))
 
-            for case in cases:
-                stattrak_count, last_knife_dt, last_gloves_dt = process_case(
-                    case, writer, all_cases, descriptions_json,
-                    stattrak_count, last_knife_dt, last_gloves_dt, skin_counter,
-                    rarity_counter, case_counter, special_drops
-                )
-                total += 1
+            stattrak_count, last_knife_dt, last_gloves_dt = process_page(
+                cases, csv_rows, all_cases, desc_map,
+                stattrak_count, last_knife_dt, last_gloves_dt, skin_counter,
+                rarity_counter, case_counter, special_drops
+            )
+            total += len(cases)
 
-            cursor = data.get("cursor")
-            if not cursor:
-                break
+            # One writerows per page instead of a writerow per case.
+            writer.writerows(csv_rows)
+            csv_rows.clear()
 
-            url = (
-                f"https://steamcommunity.com/id/{steamid}/inventoryhistory/?ajax=1"
-                f"&cursor[time]={cursor['time']}"
-                f"&cursor[time_frac]={cursor['time_frac']}"
-                f"&cursor[s]={cursor['s']}"
-            )
-            time.sleep(3)
+    save_cursors(page_cursors)
 
     return total, stattrak_count, last_knife_dt, last_gloves_dt, all_cases, skin_counter, rarity_counter, case_counter, special_drops
 
 def count_case_openings():
     url = f"https://steamcommunity.com/id/{steamid}/inventoryhistory/?ajax=1"
-    total, stattrak_count, last_knife_dt, last_gloves_dt, all_cases, skin_counter, rarity_counter, case_counter, special_drops = paginate_inventory(url, cookies)
+    total, stattrak_count, last_knife_dt, last_gloves_dt, all_cases, skin_counter, rarity_counter, case_counter, special_drops = paginate_inventory(url, SESSION)
 
     print(f"\n{YELLOW}Total Cases Opened: {total}{RESET}")
     print(f"{YELLOW}Total StatTrak™ Items: {stattrak_count}{RESET}")
@@ -295,7 +546,7 @@ def count_case_openings():
         print(f"{case} → {count} ({pct:.2f}%){RESET}")
 
     print_heading("\n--- Top 3 Opened Skins ---")
-    for skin, count in Counter(skin_counter).most_common(3):
+    for skin, count in skin_counter.most_common(3):
         print(f"{skin.title()}: {count}")
 
     # --- Print all special drops ---
@@ -310,8 +561,9 @@ def count_case_openings():
     else:
         print(f"{DARK_RED}No special drops found.{RESET}")
 
-    print_item_history("knife", last_knife_dt, all_cases)
-    print_item_history("gloves", last_gloves_dt, all_cases)
+    case_dts = sorted(case[1] for case in all_cases if case[1])
+    print_item_history("knife", last_knife_dt, case_dts)
+    print_item_history("gloves", last_gloves_dt, case_dts)
 
 if __name__ == "__main__":
     count_case_openings()